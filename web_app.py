@@ -4,10 +4,26 @@ import os
 import json
 import sqlite3
 import subprocess
+import fcntl
+import atexit
 import re
+import stat
 import time
-from datetime import datetime, timedelta
-from flask import Flask, jsonify, render_template_string, send_from_directory, abort, request, Response
+import uuid
+import hashlib
+import gzip
+import functools
+import urllib.parse
+import threading
+import queue
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from flask import Flask, jsonify, abort, request, Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.wsgi import wrap_file
+import requests
 
 try:
     import docker
@@ -15,7 +31,41 @@ try:
 except:
     docker_client = None
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializes SSE/NDJSON payloads straight to bytes
+if orjson is not None:
+    dumps_bytes = orjson.dumps
+else:
+    def dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Route jsonify/request.get_json through orjson instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding to str and re-encoding
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 DB_PATH = os.environ.get('DB_PATH', '/data/birdnet.db')
 AUDIO_DIR = os.environ.get('AUDIO_DIR', '/data')
@@ -31,15 +81,42 @@ DEFAULT_CONFIG = {
     'birdweather_token': ''
 }
 
+# Parsed config file, re-read only when its mtime changes
+_cfg_cache = {'mtime': 0, 'value': None}
+
 def load_config():
-    if os.path.exists(CONFIG_PATH):
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        return DEFAULT_CONFIG.copy()
+    if st.st_mtime_ns != _cfg_cache['mtime']:
         with open(CONFIG_PATH, 'r') as f:
-            return {**DEFAULT_CONFIG, **json.load(f)}
-    return DEFAULT_CONFIG.copy()
+            _cfg_cache['value'] = {**DEFAULT_CONFIG, **json.load(f)}
+        _cfg_cache['mtime'] = st.st_mtime_ns
+    return _cfg_cache['value'].copy()
 
 def save_config(config):
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Write to a uniquely named temp file and rename over the original, so readers never
+    # see a partial file and concurrent saves can't truncate each other's temp file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(CONFIG_PATH) or '.', prefix='.config-', suffix='.tmp')
+    try:
+        try:
+            mode = os.stat(CONFIG_PATH).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.fchmod(fd, mode)  # mkstemp creates 0600; the detector container reads this file too
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    _cfg_cache['mtime'] = 0
 
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -436,7 +513,7 @@ HTML_TEMPLATE = '''
             <p class="refresh-info">Note: Detector must be restarted for changes to take effect</p>
         </div>
         
-        <p class="refresh-info" id="refresh-info">Auto-refreshes every 30 seconds</p>
+        <p class="refresh-info" id="refresh-info">Auto-refreshes every 15 seconds</p>
     </div>
     
     <script>
@@ -480,7 +557,7 @@ HTML_TEMPLATE = '''
             card.className = 'detection-card';
             card.innerHTML = `
                 <div class="bird-info">
-                    <h3>${det.common_name}</h3>
+                    <h3></h3>
                     <div class="bird-meta">
                         <span>${formatTime(det.timestamp)}</span>
                         <span class="confidence ${getConfidenceClass(det.confidence)}">
@@ -489,11 +566,13 @@ HTML_TEMPLATE = '''
                     </div>
                 </div>
                 <div class="audio-player">
-                    <button class="play-btn" data-audio="${det.audio_url || ''}" ${!det.audio_url ? 'disabled' : ''}>▶</button>
+                    <button class="play-btn" ${!det.audio_url ? 'disabled' : ''}>▶</button>
                     <span class="audio-status">${det.audio_url ? 'Play' : 'No audio'}</span>
                     <audio preload="none"></audio>
                 </div>
             `;
+            // Species names go in as text, never through the HTML parser
+            card.querySelector('h3').textContent = det.common_name;
             
             const btn = card.querySelector('.play-btn');
             const audio = card.querySelector('audio');
@@ -533,33 +612,51 @@ HTML_TEMPLATE = '''
             return card;
         }
         
-        async function loadData() {
-            try {
-                const [statsResp, detectionsResp] = await Promise.all([
-                    fetch('/api/stats'),
-                    fetch('/api/detections?limit=50')
-                ]);
-                
-                const stats = await statsResp.json();
-                const detections = await detectionsResp.json();
-                
-                document.getElementById('today-count').textContent = stats.today || 0;
-                document.getElementById('week-count').textContent = stats.week || 0;
-                document.getElementById('species-count').textContent = stats.species || 0;
-                document.getElementById('total-count').textContent = stats.total || 0;
-                
-                const container = document.getElementById('detections');
+        // Newest timestamp rendered so far; after the first load only deltas are fetched
+        const MAX_CARDS = 50;
+        let lastTs = null;
+        const shownIds = new Set();
+
+        function renderStats(stats) {
+            document.getElementById('today-count').textContent = stats.today || 0;
+            document.getElementById('week-count').textContent = stats.week || 0;
+            document.getElementById('species-count').textContent = stats.species || 0;
+            document.getElementById('total-count').textContent = stats.total || 0;
+        }
+        
+        function renderDetections(detections) {
+            const container = document.getElementById('detections');
+            const firstLoad = lastTs === null;
+            // "since" is inclusive, so the previous newest row comes back again
+            const fresh = detections.filter(det => !shownIds.has(det.id));
+            if (detections.length > 0) {
+                lastTs = detections[0].timestamp;
+            }
+            
+            if (firstLoad) {
                 container.innerHTML = '';
-                
-                if (detections.length === 0) {
+            }
+            if (fresh.length === 0) {
+                if (firstLoad) {
                     container.innerHTML = '<div class="empty-state">No detections yet. Waiting for birds...</div>';
-                } else {
-                    detections.forEach(det => {
-                        container.appendChild(createDetectionCard(det));
-                    });
                 }
-            } catch (err) {
-                console.error('Failed to load data:', err);
+                return;
+            }
+            
+            const empty = container.querySelector('.empty-state');
+            if (empty) empty.remove();
+            const frag = document.createDocumentFragment();
+            fresh.forEach(det => {
+                shownIds.add(det.id);
+                const card = createDetectionCard(det);
+                card.dataset.id = det.id;
+                frag.appendChild(card);
+            });
+            container.prepend(frag);
+            
+            while (container.children.length > MAX_CARDS) {
+                shownIds.delete(Number(container.lastElementChild.dataset.id));
+                container.lastElementChild.remove();
             }
         }
         
@@ -623,88 +720,148 @@ HTML_TEMPLATE = '''
         
         async function restartDetector() {
             if (!confirm('Restart the BirdNET detector? This will briefly interrupt detection.')) return;
+            const status = document.getElementById('save-status');
+            const show = (ok, text) => {
+                status.className = 'save-status ' + (ok ? 'success' : 'error');
+                status.textContent = text;
+            };
             try {
                 const resp = await fetch('/api/restart', { method: 'POST' });
-                const status = document.getElementById('save-status');
-                if (resp.ok) {
-                    status.className = 'save-status success';
-                    status.textContent = 'Detector restart initiated';
-                } else {
-                    status.className = 'save-status error';
-                    status.textContent = 'Failed to restart detector';
+                const data = await resp.json();
+                if (!resp.ok) throw new Error(data.message || 'HTTP ' + resp.status);
+                show(true, 'Restarting detector\u2026');
+                // The restart runs in the background - poll its job until it finishes
+                let job = { status: 'pending' };
+                for (let i = 0; i < 90 && (job.status === 'pending' || job.status === 'running'); i++) {
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    job = await (await fetch('/api/restart/' + data.job_id)).json();
                 }
-                setTimeout(() => { status.className = 'save-status'; }, 5000);
+                if (job.status === 'ok') show(true, 'Detector restarted');
+                else if (job.status === 'error') throw new Error(job.message);
+                else throw new Error('timed out waiting for the restart');
             } catch (err) {
                 console.error('Failed to restart:', err);
+                show(false, 'Failed to restart detector: ' + err.message);
             }
+            setTimeout(() => { status.className = 'save-status'; }, 5000);
         }
         
-        // Load logs
+        // At most one request in flight per key; a newer poll aborts the stale one
+        const inflight = {};
+        async function guardedFetch(key, url) {
+            if (inflight[key]) inflight[key].abort();
+            const ac = new AbortController();
+            inflight[key] = ac;
+            try {
+                return await fetch(url, { signal: ac.signal });
+            } finally {
+                if (inflight[key] === ac) delete inflight[key];
+            }
+        }
+
+        // Single match per line; alternation order keeps error > warning > info precedence
+        const LOG_LEVEL_RE = /^(?:(?=.*(\\[ERROR\\]|[Ee]rror))|(?=.*(\\[WARNING\\]|Warning))|(?=.*(\\[INFO\\])))/;
+
+        function renderLogs(logs) {
+            const container = document.getElementById('log-container');
+            const frag = document.createDocumentFragment();
+
+            logs.forEach(line => {
+                const m = LOG_LEVEL_RE.exec(line);
+                const div = document.createElement('div');
+                div.className = 'log-line ' + (!m ? 'debug' : m[1] ? 'error' : m[2] ? 'warning' : 'info');
+                div.textContent = line;
+                frag.appendChild(div);
+            });
+            container.replaceChildren(frag);
+
+            if (document.getElementById('auto-scroll').checked) {
+                container.scrollTop = container.scrollHeight;
+            }
+        }
+
+        // Load logs (manual refresh)
         async function loadLogs() {
             const lines = document.getElementById('log-lines').value;
             try {
-                const resp = await fetch(`/api/logs?lines=${lines}`);
+                const resp = await guardedFetch('logs', `/api/logs?lines=${lines}`);
                 const data = await resp.json();
-                const container = document.getElementById('log-container');
-                container.innerHTML = '';
-
-                data.logs.forEach(line => {
-                    const div = document.createElement('div');
-                    div.className = 'log-line';
-                    if (line.includes('[ERROR]') || line.includes('Error') || line.includes('error')) {
-                        div.className += ' error';
-                    } else if (line.includes('[WARNING]') || line.includes('Warning')) {
-                        div.className += ' warning';
-                    } else if (line.includes('[INFO]')) {
-                        div.className += ' info';
-                    } else {
-                        div.className += ' debug';
-                    }
-                    div.textContent = line;
-                    container.appendChild(div);
-                });
-
-                if (document.getElementById('auto-scroll').checked) {
-                    container.scrollTop = container.scrollHeight;
-                }
+                renderLogs(data.logs);
+                logTag = null;
             } catch (err) {
+                if (err.name === 'AbortError') return;
                 console.error('Failed to load logs:', err);
             }
         }
 
-        // Check detector status
-        async function checkStatus() {
+        function renderStatus(data) {
+            const dot = document.getElementById('status-dot');
+            const text = document.getElementById('status-text');
+
+            dot.className = 'status-dot ' + data.status;
+            if (data.status === 'listening') {
+                text.textContent = 'Listening';
+            } else if (data.status === 'stale') {
+                text.textContent = `Stale (${data.minutes_ago}m ago)`;
+            } else {
+                text.textContent = 'Offline';
+            }
+        }
+
+        // Stats, new detections, detector status and (when visible) logs in one request.
+        // logTag lets the server leave logs out when they haven't changed since the last poll.
+        let logTag = null;
+        async function pollAll() {
+            const want = ['stats', 'detections', 'status'];
+            const logsVisible = document.getElementById('logs-tab').classList.contains('active');
+            let url = `/api/poll?limit=${MAX_CARDS}`;
+            if (lastTs) {
+                url += `&since=${encodeURIComponent(lastTs)}`;
+            }
+            if (logsVisible) {
+                want.push('logs');
+                url += `&lines=${document.getElementById('log-lines').value}`;
+                if (logTag) url += `&log_tag=${encodeURIComponent(logTag)}`;
+            }
+            url += `&want=${want.join(',')}`;
             try {
-                const resp = await fetch('/api/detector-status');
+                const resp = await guardedFetch('poll', url);
                 const data = await resp.json();
-                const dot = document.getElementById('status-dot');
-                const text = document.getElementById('status-text');
-
-                dot.className = 'status-dot ' + data.status;
-                if (data.status === 'listening') {
-                    text.textContent = 'Listening';
-                } else if (data.status === 'stale') {
-                    text.textContent = `Stale (${data.minutes_ago}m ago)`;
-                } else {
-                    text.textContent = 'Offline';
-                }
+                renderStats(data.stats);
+                renderDetections(data.detections);
+                renderStatus(data.status);
+                logTag = data.log_tag || null;
+                if (data.logs) renderLogs(data.logs);
             } catch (err) {
+                if (err.name === 'AbortError') return;
+                console.error('Failed to poll:', err);
                 document.getElementById('status-dot').className = 'status-dot offline';
                 document.getElementById('status-text').textContent = 'Unknown';
             }
         }
 
-        loadData();
+        // Only poll while the tab is visible; catch up immediately when it returns
+        let pollTimer = null;
+        function startPolling() {
+            if (pollTimer === null) pollTimer = setInterval(pollAll, 15000);
+        }
+        function stopPolling() {
+            clearInterval(pollTimer);
+            pollTimer = null;
+        }
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                stopPolling();
+            } else {
+                pollAll();
+                startPolling();
+            }
+        });
+
+        pollAll();
         loadSettings();
         loadLogs();
-        checkStatus();
-        setInterval(loadData, 30000);
-        setInterval(checkStatus, 15000);
-        setInterval(() => {
-            if (document.getElementById('logs-tab').classList.contains('active')) {
-                loadLogs();
-            }
-        }, 10000);
+        if (!document.hidden) startPolling();
     </script>
 </body>
 </html>
@@ -715,15 +872,34 @@ def get_db():
     conn.row_factory = sqlite3.Row
     return conn
 
+# The HTML pages have no template variables, so they are encoded (and compressed)
+# once at import and served as-is with a content hash ETag instead of going through Jinja.
+def static_page(html):
+    body = html.encode('utf-8')
+    variants = {'identity': body, 'gzip': gzip.compress(body, 9)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return variants, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def page_response(variants, etag):
+    encoding = request.accept_encodings.best_match(list(variants)[::-1], default='identity')
+    rv = Response(variants[encoding], mimetype='text/html')
+    if encoding != 'identity':
+        rv.content_encoding = encoding
+    rv.vary.add('Accept-Encoding')
+    # Each encoding is a different representation, so it needs its own strong ETag
+    rv.set_etag(etag if encoding == 'identity' else f'{etag}-{encoding}')
+    rv.cache_control.public = True
+    rv.cache_control.max_age = 300
+    return rv.make_conditional(request)
+
+INDEX_PAGE, INDEX_ETAG = static_page(HTML_TEMPLATE)
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return page_response(INDEX_PAGE, INDEX_ETAG)
 
-@app.route('/api/stats')
-def stats():
-    conn = get_db()
-    cur = conn.cursor()
-    
+def query_stats(cur):
     today = datetime.utcnow().strftime('%Y-%m-%d')
     week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
     
@@ -739,22 +915,14 @@ def stats():
     cur.execute("SELECT COUNT(*) FROM detections")
     total_count = cur.fetchone()[0]
     
-    conn.close()
-    
-    return jsonify({
+    return {
         'today': today_count,
         'week': week_count,
         'species': species_count,
         'total': total_count
-    })
-
-@app.route('/api/detections')
-def detections():
-    limit = min(int(request.args.get('limit', 50)), 500)
-    since = request.args.get('since')
+    }
 
-    conn = get_db()
-    cur = conn.cursor()
+def query_detections(cur, limit, since=None):
     if since:
         cur.execute('''
             SELECT id, timestamp, common_name, species_code, confidence, audio_file
@@ -771,11 +939,8 @@ def detections():
             LIMIT ?
         ''', (limit,))
 
-    rows = cur.fetchall()
-    conn.close()
-
     results = []
-    for row in rows:
+    for row in cur.fetchall():
         audio_file = row['audio_file']
         audio_url = None
         if audio_file:
@@ -789,7 +954,27 @@ def detections():
             'confidence': row['confidence'],
             'audio_url': audio_url
         })
+    return results
+
+@app.route('/api/stats')
+def stats():
+    conn = get_db()
+    result = query_stats(conn.cursor())
+    conn.close()
+    return jsonify(result)
 
+@app.route('/api/detections')
+def detections():
+    limit = min(int(request.args.get('limit', 50)), 500)
+    since = request.args.get('since')
+
+    conn = get_db()
+    results = query_detections(conn.cursor(), limit, since)
+    conn.close()
+
+    if request.args.get('format') == 'ndjson':
+        # One detection per line, so clients can render rows as they arrive
+        return Response((dumps_bytes(r) + b'\n' for r in results), mimetype='application/x-ndjson')
     return jsonify(results)
 
 @app.route('/api/config', methods=['GET', 'POST'])
@@ -803,112 +988,486 @@ def config():
         save_config(current)
         return jsonify({'status': 'ok'})
 
-@app.route('/api/restart', methods=['POST'])
-def restart():
+# Docker restarts block for several seconds, so they run off the request thread.
+# Job state lives in the database so any gunicorn worker can answer a status poll.
+_executor = ThreadPoolExecutor(max_workers=2)
+MAX_RESTART_JOBS = 20
+
+def _restart_db():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.execute('CREATE TABLE IF NOT EXISTS restart_jobs (id TEXT PRIMARY KEY, status TEXT, message TEXT, ts TEXT)')
+    return conn
+
+def _set_restart_job(job_id, status, message=None):
+    conn = _restart_db()
     try:
-        if docker_client is None:
-            return jsonify({'status': 'error', 'message': 'Docker client not available'}), 500
+        with conn:
+            conn.execute('INSERT OR REPLACE INTO restart_jobs (id, status, message, ts) VALUES (?, ?, ?, ?)',
+                         (job_id, status, message, datetime.utcnow().isoformat()))
+            conn.execute('DELETE FROM restart_jobs WHERE id NOT IN '
+                         '(SELECT id FROM restart_jobs ORDER BY ts DESC LIMIT ?)', (MAX_RESTART_JOBS,))
+    finally:
+        conn.close()
 
-        container = docker_client.containers.get('birdnet-detector')
-        container.restart()
-        return jsonify({'status': 'ok'})
+# Resolved once and shared by the restart jobs and the log tailer; dropped by
+# _forget_detector() when Docker says the container is gone so the next call re-resolves it.
+_detector_container = None
+_detector_lock = threading.Lock()
+
+def _get_detector():
+    global _detector_container
+    container = _detector_container
+    if container is None:
+        with _detector_lock:
+            if _detector_container is None:
+                _detector_container = docker_client.containers.get('birdnet-detector')
+            container = _detector_container
+    return container
+
+def _forget_detector():
+    global _detector_container
+    with _detector_lock:
+        _detector_container = None
+
+def _restart_detector():
+    try:
+        _get_detector().restart()
+    except docker.errors.NotFound:
+        _forget_detector()
+        _get_detector().restart()
+
+def _run_restart_job(job_id):
+    try:
+        _set_restart_job(job_id, 'running')
+        _restart_detector()
     except Exception as e:
+        _set_restart_job(job_id, 'error', str(e))
+    else:
+        _set_restart_job(job_id, 'ok')
+
+@app.route('/api/restart', methods=['POST'])
+def restart():
+    if docker_client is None:
+        return jsonify({'status': 'error', 'message': 'Docker client not available'}), 500
+
+    job_id = uuid.uuid4().hex
+    try:
+        _set_restart_job(job_id, 'pending')
+    except sqlite3.Error as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
+    _executor.submit(_run_restart_job, job_id)
+    return jsonify({'status': 'accepted', 'job_id': job_id}), 202
+
+@app.route('/api/restart/<job_id>')
+def restart_status(job_id):
+    conn = _restart_db()
+    try:
+        row = conn.execute('SELECT status, message FROM restart_jobs WHERE id = ?', (job_id,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return jsonify({'status': 'unknown'}), 404
+    status, message = row
+    if status == 'error':
+        return jsonify({'status': 'error', 'message': message})
+    return jsonify({'status': status})
 
 @app.route('/audio/<filename>')
 def serve_audio(filename):
-    if not filename.endswith('.wav') or '/' in filename or '\\\\' in filename:
+    if not filename.endswith('.wav') or '/' in filename or '\\' in filename or '..' in filename:
         abort(400)
     
-    filepath = os.path.join(AUDIO_DIR, filename)
-    if not os.path.exists(filepath):
+    # Single open + fstat instead of exists() followed by send_from_directory's own checks
+    try:
+        fd = os.open(os.path.join(AUDIO_DIR, filename), os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    except OSError:
         abort(404)
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            abort(404)
+        f = os.fdopen(fd, 'rb')
+    except BaseException:
+        os.close(fd)
+        raise
     
-    return send_from_directory(AUDIO_DIR, filename, mimetype='audio/wav')
+    rv = app.response_class(wrap_file(request.environ, f), mimetype='audio/wav', direct_passthrough=True)
+    rv.content_length = st.st_size
+    rv.last_modified = st.st_mtime
+    rv.set_etag(f'{st.st_ino:x}-{st.st_size:x}-{int(st.st_mtime):x}')
+    # Clips are never rewritten once saved, so replays can come straight from the browser cache
+    rv.cache_control.public = True
+    rv.cache_control.max_age = 3600
+    rv.cache_control.immutable = True
+    return rv.make_conditional(request, accept_ranges=True, complete_length=st.st_size)
+
+WIKI_SUMMARY_URL = 'https://en.wikipedia.org/api/rest_v1/page/summary/'
+BIRD_FALLBACK_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100" fill="#2d8a68" opacity="0.3">'
+    b'<ellipse cx="45" cy="55" rx="25" ry="18"/>'
+    b'<circle cx="30" cy="45" r="10"/>'
+    b'<polygon points="20,45 8,42 20,48"/>'
+    b'<polygon points="65,60 90,55 88,65"/>'
+    b'</svg>'
+)
+
+@functools.lru_cache(maxsize=512)
+def lookup_bird_image(common_name):
+    """Wikipedia thumbnail URL for a species, or None if its article has no image.
+
+    Network errors propagate, so lru_cache only remembers real answers.
+    """
+    title = urllib.parse.quote(common_name.replace(' ', '_'), safe='')
+    resp = requests.get(WIKI_SUMMARY_URL + title, timeout=5,
+                        headers={'User-Agent': 'BirdNET-Realtime (+https://github.com/jrork/birdnet)'})
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    return (resp.json().get('thumbnail') or {}).get('source')
+
+@app.route('/api/bird-image/<path:name>')
+def bird_image(name):
+    """Redirect to a species thumbnail so browsers cache it instead of asking Wikipedia themselves."""
+    try:
+        url = lookup_bird_image(name)
+        max_age = 604800
+    except Exception:
+        url = None
+        max_age = 300  # lookup failed - let the browser retry soon
+
+    if url:
+        return Response(status=302, headers={'Location': url, 'Cache-Control': f'public, max-age={max_age}'})
+    return Response(BIRD_FALLBACK_SVG, mimetype='image/svg+xml',
+                    headers={'Cache-Control': f'public, max-age={max_age}'})
 
 @app.route('/health')
 def health():
     return jsonify({'status': 'ok'})
 
+# One background thread per worker follows the detector's log stream, so
+# /api/logs and /api/detector-status read local state instead of calling Docker.
+LOG_RING_SIZE = 1000
+LOG_RING = deque(maxlen=LOG_RING_SIZE)
+LAST_LOG_TS = None          # most recent "YYYY-MM-DD HH:MM:SS" seen in the logs
+LAST_LOG_EPOCH = None       # LAST_LOG_TS as a POSIX timestamp (log times are UTC)
+DETECTOR_STATE = None       # container status at last (re)connect, None if unreachable
+DETECTOR_ERROR = None
+LOG_VERSION = 0             # bumped whenever LOG_RING changes
+LOG_EPOCH = uuid.uuid4().hex[:8]  # distinguishes this worker's counter from other workers'
+TS_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+def _docker_stamp(stamp):
+    """Sortable key for a Docker RFC3339Nano log timestamp ("2026-01-10T17:09:07.123456789Z")."""
+    secs, _, frac = stamp.rstrip('Z').partition('.')
+    return secs, int(frac.ljust(9, '0')[:9] or 0)
+
+def _note_log_line(line):
+    global LAST_LOG_TS, LAST_LOG_EPOCH
+    m = TS_RE.search(line)
+    if m and m.group(0) != LAST_LOG_TS:
+        # Only parse when the second changes - most lines repeat the previous timestamp
+        try:
+            epoch = datetime.fromisoformat(m.group(0)).replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            return
+        # Epoch first, so a reader that sees the new timestamp never sees a missing epoch
+        LAST_LOG_EPOCH = epoch
+        LAST_LOG_TS = m.group(0)
+
+def _tail_detector_logs():
+    global LOG_RING, DETECTOR_STATE, DETECTOR_ERROR, LOG_VERSION
+    while True:
+        try:
+            container = _get_detector()
+            container.reload()
+            DETECTOR_STATE = container.status
+            DETECTOR_ERROR = None
+            if container.status != 'running':
+                # logs(follow=True) returns at once for a stopped container; keep the
+                # last logs on display and just wait for it to come back
+                time.sleep(5)
+                continue
+
+            # Read the backlog into a fresh ring and swap it in whole, so readers never
+            # see a half-filled ring, then follow from the last backlog line onwards
+            ring = deque(maxlen=LOG_RING_SIZE)
+            last = None
+            for line in container.logs(tail=LOG_RING_SIZE, timestamps=True).decode('utf-8', errors='replace').splitlines():
+                stamp, _, text = line.partition(' ')
+                ring.append(text)
+                last = stamp
+            for text in ring:
+                _note_log_line(text)
+            LOG_RING = ring
+            LOG_VERSION += 1
+
+            last_key = _docker_stamp(last) if last else None
+            since = datetime.fromisoformat(last_key[0]).replace(tzinfo=timezone.utc).timestamp() if last else None
+            stream = container.logs(stream=True, follow=True, timestamps=True, since=since)
+            for chunk in stream:
+                for line in chunk.decode('utf-8', errors='replace').splitlines():
+                    stamp, _, text = line.partition(' ')
+                    if last_key is not None:
+                        if _docker_stamp(stamp) <= last_key:
+                            continue  # already in the backlog
+                        last_key = None
+                    ring.append(text)
+                    LOG_VERSION += 1
+                    _note_log_line(text)
+            # Stream ended - the container stopped or is restarting
+            container.reload()
+            DETECTOR_STATE = container.status
+        except Exception as e:
+            if isinstance(e, docker.errors.APIError):
+                _forget_detector()  # removed or recreated - look it up again next time
+            DETECTOR_STATE = None
+            DETECTOR_ERROR = str(e)
+        time.sleep(5)
+
+if docker_client is not None:
+    threading.Thread(target=_tail_detector_logs, name='detector-log-tailer', daemon=True).start()
+
+def read_detector_logs(lines):
+    if lines <= 0:
+        return []
+    return list(LOG_RING)[-lines:]
+
+def log_tag(lines):
+    """Changes whenever the last `lines` log lines could have changed."""
+    return f'{LOG_EPOCH}-{LOG_VERSION}-{lines}'
+
 @app.route('/api/logs')
 def logs():
-    lines = min(int(request.args.get('lines', 100)), 1000)
-    try:
-        if docker_client is None:
-            return jsonify({'logs': ['Docker client not available']}), 500
-
-        container = docker_client.containers.get('birdnet-detector')
-        log_output = container.logs(tail=lines, timestamps=False).decode('utf-8', errors='replace')
-        log_lines = log_output.strip().split('\n') if log_output.strip() else []
-        return jsonify({'logs': log_lines})
-    except Exception as e:
-        return jsonify({'logs': [f'Error: {str(e)}']}), 500
+    lines = max(1, min(int(request.args.get('lines', 100)), 1000))
+    if docker_client is None:
+        return jsonify({'logs': ['Docker client not available']}), 500
+    if DETECTOR_ERROR is not None:
+        return jsonify({'logs': [f'Error: {DETECTOR_ERROR}']}), 500
+
+    # Tag taken before the read, so a line arriving in between just costs one extra refresh
+    tag = log_tag(lines)
+    if request.if_none_match.contains_weak(tag):
+        rv = Response(status=304)
+    else:
+        rv = jsonify({'logs': read_detector_logs(lines)})
+    rv.set_etag(tag, weak=True)
+    rv.cache_control.no_cache = True
+    return rv
+
+def get_detector_status():
+    if docker_client is None:
+        return {'status': 'offline', 'error': 'Docker client not available'}
+    if DETECTOR_ERROR is not None:
+        return {'status': 'offline', 'error': DETECTOR_ERROR}
+
+    # Check container status first
+    if DETECTOR_STATE != 'running':
+        return {'status': 'offline', 'container_status': DETECTOR_STATE}
+
+    # Timestamp of the most recent log line (format: 2026-01-10 17:09:07 [INFO])
+    last_ts, last_epoch = LAST_LOG_TS, LAST_LOG_EPOCH
+    if last_ts is None:
+        return {'status': 'offline', 'last_activity': None}
+
+    minutes_ago = int((time.time() - last_epoch) / 60)
+
+    if minutes_ago < 2:
+        return {'status': 'listening', 'minutes_ago': minutes_ago, 'last_activity': last_ts}
+    elif minutes_ago < 10:
+        return {'status': 'stale', 'minutes_ago': minutes_ago, 'last_activity': last_ts}
+    else:
+        return {'status': 'offline', 'minutes_ago': minutes_ago, 'last_activity': last_ts}
 
 @app.route('/api/detector-status')
 def detector_status():
-    try:
-        if docker_client is None:
-            return jsonify({'status': 'offline', 'error': 'Docker client not available'})
-
-        container = docker_client.containers.get('birdnet-detector')
-
-        # Check container status first
-        if container.status != 'running':
-            return jsonify({'status': 'offline', 'container_status': container.status})
-
-        # Get last few log lines and check timestamp
-        log_output = container.logs(tail=20, timestamps=False).decode('utf-8', errors='replace')
+    return jsonify(get_detector_status())
 
-        # Parse timestamps from log lines (format: 2026-01-10 17:09:07 [INFO])
-        timestamps = re.findall(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', log_output)
+@app.route('/api/poll')
+def poll():
+    """Combined dashboard poll - stats, new detections, detector status and logs in one response."""
+    want = set(request.args.get('want', 'stats,detections,status').split(','))
+    result = {}
 
-        if not timestamps:
-            return jsonify({'status': 'offline', 'last_activity': None})
+    if 'stats' in want or 'detections' in want:
+        conn = get_db()
+        cur = conn.cursor()
+        if 'stats' in want:
+            result['stats'] = query_stats(cur)
+        if 'detections' in want:
+            limit = min(int(request.args.get('limit', 50)), 500)
+            result['detections'] = query_detections(cur, limit, request.args.get('since'))
+        conn.close()
 
-        # Get most recent timestamp
-        last_ts = timestamps[-1]
-        last_dt = datetime.strptime(last_ts, '%Y-%m-%d %H:%M:%S')
-        now = datetime.utcnow()
-        diff = now - last_dt
-        minutes_ago = int(diff.total_seconds() / 60)
+    if 'status' in want:
+        result['status'] = get_detector_status()
 
-        if minutes_ago < 2:
-            return jsonify({'status': 'listening', 'minutes_ago': minutes_ago, 'last_activity': last_ts})
-        elif minutes_ago < 10:
-            return jsonify({'status': 'stale', 'minutes_ago': minutes_ago, 'last_activity': last_ts})
+    if 'logs' in want:
+        lines = max(1, min(int(request.args.get('lines', 100)), 1000))
+        if docker_client is None:
+            result['logs'] = ['Docker client not available']
+        elif DETECTOR_ERROR is not None:
+            result['logs'] = [f'Error: {DETECTOR_ERROR}']
         else:
-            return jsonify({'status': 'offline', 'minutes_ago': minutes_ago, 'last_activity': last_ts})
+            # Clients echo back log_tag; logs are left out when nothing has changed
+            tag = log_tag(lines)
+            result['log_tag'] = tag
+            if request.args.get('log_tag') != tag:
+                result['logs'] = read_detector_logs(lines)
 
-    except Exception as e:
-        return jsonify({'status': 'offline', 'error': str(e)})
+    return jsonify(result)
 
 RTSP_URL = os.environ.get('RTSP_URL', '')
+PIPE_SIZE = 1 << 20
+STREAM_READ_SIZE = 64 * 1024
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)  # Linux-only, exposed by fcntl since Python 3.10
+
+def probe_audio_codec():
+    """Codec name of the RTSP source's first audio stream, or None if it can't be probed."""
+    cmd = [
+        'ffprobe', '-v', 'error', '-rtsp_transport', 'tcp', '-select_streams', 'a:0',
+        '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', RTSP_URL
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+def stop_process(proc):
+    """SIGTERM first so ffmpeg can tear down its RTSP session; SIGKILL if it hasn't exited after 2s."""
+    proc.terminate()
+    try:
+        proc.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+class AudioBroadcaster:
+    """One shared ffmpeg process whose output is fanned out to every listener.
+
+    ffmpeg starts with the first subscriber and is stopped when the last one leaves.
+    Each listener gets a bounded queue; a listener that falls behind loses its
+    oldest chunks rather than stalling everyone else.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs = set()
+        self._proc = None
+        self._codec = None
+        self._mimetype = None
+
+    def subscribe(self):
+        """Register a listener; returns its queue and the mimetype of the running stream."""
+        if self._codec is None:
+            # Outside the lock - probing the camera can take seconds
+            self._codec = probe_audio_codec()
+        q = queue.Queue(maxsize=32)
+        with self._lock:
+            self._subs.add(q)
+            if self._proc is None:
+                self._start()
+            return q, self._mimetype
+
+    def unsubscribe(self, q):
+        proc = None
+        with self._lock:
+            self._subs.discard(q)
+            if not self._subs and self._proc is not None:
+                proc, self._proc = self._proc, None
+        if proc is not None:
+            stop_process(proc)
+
+    def close(self):
+        """Stop ffmpeg regardless of listeners (worker shutdown)."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            stop_process(proc)
+
+    def _start(self):
+        cmd = [
+            'ffmpeg',
+            # Low-latency input: skip stream probing and demuxer buffering so audio starts flowing at once
+            '-fflags', '+nobuffer', '-flags', 'low_delay',
+            '-probesize', '32', '-analyzeduration', '0', '-rtbufsize', '64k',
+            '-rtsp_transport', 'tcp', '-reorder_queue_size', '0',
+            '-i', RTSP_URL, '-vn', '-flush_packets', '1'
+        ]
+        if self._codec == 'aac':
+            # Browsers decode AAC natively, so remux to ADTS instead of re-encoding
+            cmd += ['-c:a', 'copy', '-f', 'adts', '-']
+            self._mimetype = 'audio/aac'
+        else:
+            cmd += ['-f', 'mp3', '-acodec', 'libmp3lame', '-ac', '1', '-ar', '16000', '-b:a', '64k', '-']
+            self._mimetype = 'audio/mpeg'
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=PIPE_SIZE)
+        try:
+            # Grow the kernel pipe too, so ffmpeg isn't throttled by the 64 KiB default
+            fcntl.fcntl(proc.stdout.fileno(), F_SETPIPE_SZ, PIPE_SIZE)
+        except OSError:
+            pass
+        self._proc = proc
+        threading.Thread(target=self._pump, args=(proc,), name='audio-broadcaster', daemon=True).start()
+
+    def _pump(self, proc):
+        lock, subs_set, offer = self._lock, self._subs, self._offer
+        read1, read_size = proc.stdout.read1, STREAM_READ_SIZE
+        # read1() returns whatever is buffered (up to 64 KiB) instead of waiting to fill the buffer
+        for chunk in iter(lambda: read1(read_size), b''):
+            with lock:
+                subs = list(subs_set)
+            for q in subs:
+                offer(q, chunk)
+
+        proc.stdout.close()
+        proc.wait()
+        # ffmpeg exited on its own (e.g. RTSP dropped) - end every listener's stream
+        with self._lock:
+            if self._proc is not proc:
+                return
+            self._proc = None
+            subs = list(self._subs)
+        for q in subs:
+            self._offer(q, None)
+
+    @staticmethod
+    def _offer(q, item):
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                pass
+
+AUDIO_BROADCASTER = AudioBroadcaster()
+atexit.register(AUDIO_BROADCASTER.close)
 
 @app.route('/api/audio-stream')
 def audio_stream():
-    """Stream unfiltered audio from RTSP as MP3 for browser playback."""
+    """Stream unfiltered audio from RTSP for browser playback (AAC passthrough, else MP3)."""
     if not RTSP_URL:
         abort(503, 'RTSP_URL not configured')
 
+    q, mimetype = AUDIO_BROADCASTER.subscribe()
+
     def generate():
-        cmd = [
-            'ffmpeg', '-rtsp_transport', 'tcp', '-i', RTSP_URL,
-            '-vn', '-f', 'mp3', '-acodec', 'libmp3lame',
-            '-ac', '1', '-ar', '16000', '-b:a', '64k',
-            '-'
-        ]
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-        try:
-            while True:
-                chunk = proc.stdout.read(4096)
-                if not chunk:
-                    break
-                yield chunk
-        finally:
-            proc.kill()
+        get = q.get
+        while True:
+            chunk = get()
+            if chunk is None:
+                break
+            yield chunk
 
-    return Response(generate(), mimetype='audio/mpeg',
-                    headers={'Cache-Control': 'no-cache'})
+    rv = Response(generate(), mimetype=mimetype,
+                  headers={'Cache-Control': 'no-cache'})
+    rv.call_on_close(lambda: AUDIO_BROADCASTER.unsubscribe(q))
+    return rv
 
 TUNER_HTML = '''
 <!DOCTYPE html>
@@ -1113,20 +1672,37 @@ TUNER_HTML = '''
         hpEnabled.addEventListener('change', updateFilters);
         lpEnabled.addEventListener('change', updateFilters);
 
+        // Bars are drawn in a few colour tiers (one fill per tier) instead of one fillStyle per bar
+        const COLOR_TIERS = 8;
+        const tierColors = [];
+        for (let t = 0; t < COLOR_TIERS; t++) {
+            const v = (t + 0.5) / COLOR_TIERS;
+            tierColors.push(`hsl(${200 + v * 160}, 80%, ${40 + v * 30}%)`);
+        }
+        let freqData = null;
+
+        // Resizing clears the backing store, so only do it when the element actually changes size
+        let dpr = window.devicePixelRatio || 1;
+        function resizeCanvas() {
+            dpr = window.devicePixelRatio || 1;
+            const rect = canvas.getBoundingClientRect();
+            canvas.width = Math.round(rect.width * dpr);
+            canvas.height = Math.round(rect.height * dpr);
+        }
+        resizeCanvas();
+        new ResizeObserver(resizeCanvas).observe(canvas);
+
         function drawSpectrum() {
             if (!running) return;
             animId = requestAnimationFrame(drawSpectrum);
             if (!analyser) return;
 
-            const dpr = window.devicePixelRatio || 1;
-            const rect = canvas.getBoundingClientRect();
-            canvas.width = rect.width * dpr;
-            canvas.height = rect.height * dpr;
             const w = canvas.width;
             const h = canvas.height;
 
             const bufLen = analyser.frequencyBinCount;
-            const data = new Uint8Array(bufLen);
+            if (!freqData || freqData.length !== bufLen) freqData = new Uint8Array(bufLen);
+            const data = freqData;
             analyser.getByteFrequencyData(data);
 
             canvasCtx.fillStyle = '#0a0a12';
@@ -1140,12 +1716,16 @@ TUNER_HTML = '''
 
             // Draw frequency bars (linear scale within 0-8kHz)
             const barW = Math.max(1, w / maxBin);
+            const baseY = h - 20 * dpr;
+            const tierPaths = tierColors.map(() => new Path2D());
             for (let i = 0; i < maxBin; i++) {
-                const v = data[i] / 255;
-                const barH = v * h * 0.9;
-                const hue = 200 + v * 160;
-                canvasCtx.fillStyle = `hsl(${hue}, 80%, ${40 + v * 30}%)`;
-                canvasCtx.fillRect(i * barW, h - barH - 20 * dpr, barW + 1, barH);
+                if (data[i] === 0) continue;
+                const barH = (data[i] / 255) * h * 0.9;
+                tierPaths[(data[i] * COLOR_TIERS) >> 8].rect(i * barW, baseY - barH, barW + 1, barH);
+            }
+            for (let t = 0; t < COLOR_TIERS; t++) {
+                canvasCtx.fillStyle = tierColors[t];
+                canvasCtx.fill(tierPaths[t]);
             }
 
             // Frequency axis labels
@@ -1262,62 +1842,172 @@ TUNER_HTML = '''
 </html>
 '''
 
+TUNER_PAGE, TUNER_ETAG = static_page(TUNER_HTML)
+
 @app.route('/tuner')
 def tuner():
-    return render_template_string(TUNER_HTML)
+    return page_response(TUNER_PAGE, TUNER_ETAG)
+
+# One background thread per worker polls the DB for new detections and fans
+# them out to every connected SSE client through a per-client queue.
+SUBSCRIBERS = set()
+SSE_HEARTBEAT = b"event: heartbeat\ndata: ping\n\n"
+_subscribers_lock = threading.Lock()
+_detection_tailer = None
+
+# species_code -> thumbnail URL (or None), mirroring the species_images table
+_species_images = {}
+# Wikipedia lookups run on their own thread so a slow or offline network never
+# holds up the SSE fan-out. Failed species are retried with a doubling backoff.
+_image_executor = ThreadPoolExecutor(max_workers=1)
+_image_pending = set()
+_image_failures = {}        # species_code -> (retry_at, backoff seconds)
+_image_lock = threading.Lock()
+IMAGE_RETRY_MIN = 60
+IMAGE_RETRY_MAX = 3600
+IMAGE_UNKNOWN = object()    # get_bird_image(): no answer yet
+
+def _resolve_bird_image(species_code, common_name):
+    try:
+        url = lookup_bird_image(common_name)
+    except Exception:
+        with _image_lock:
+            _, backoff = _image_failures.get(species_code, (0, IMAGE_RETRY_MIN / 2))
+            backoff = min(backoff * 2, IMAGE_RETRY_MAX)
+            _image_failures[species_code] = (time.monotonic() + backoff, backoff)
+            _image_pending.discard(species_code)
+        return
+    try:
+        conn = sqlite3.connect(DB_PATH, timeout=10)
+        try:
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO species_images (code, url, ts) VALUES (?, ?, ?)',
+                             (species_code, url, datetime.utcnow().isoformat()))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass  # still cached in memory for this worker
+    with _image_lock:
+        _species_images[species_code] = url
+        _image_failures.pop(species_code, None)
+        _image_pending.discard(species_code)
+
+def get_bird_image(conn, species_code, common_name):
+    """Thumbnail URL (or None) for a species if already known, else IMAGE_UNKNOWN.
+
+    Answers are persisted so Wikipedia is asked once per deployment; unknown species
+    are looked up in the background and never block the caller.
+    """
+    if species_code in _species_images:
+        return _species_images[species_code]
+    row = conn.execute('SELECT url FROM species_images WHERE code = ?', (species_code,)).fetchone()
+    if row is not None:
+        _species_images[species_code] = row[0]
+        return row[0]
+    with _image_lock:
+        if species_code in _image_pending:
+            return IMAGE_UNKNOWN
+        failure = _image_failures.get(species_code)
+        if failure is not None and time.monotonic() < failure[0]:
+            return IMAGE_UNKNOWN
+        _image_pending.add(species_code)
+    _image_executor.submit(_resolve_bird_image, species_code, common_name)
+    return IMAGE_UNKNOWN
+
+def _tail_detections():
+    # One long-lived connection; sqlite3's statement cache keeps the SELECT prepared
+    # across polls, and plain tuples skip building a sqlite3.Row per result.
+    query = '''
+        SELECT id, timestamp, common_name, species_code, confidence, audio_file
+        FROM detections
+        WHERE id > ?
+        ORDER BY id ASC
+    '''
+    poll_interval = 2
+    conn = None
+    last_id = None
+    # Bound locally so the loop uses LOAD_FAST instead of module/global lookups
+    basename = os.path.basename
+    dumps = dumps_bytes
+    sleep = time.sleep
+    subscribers_lock = _subscribers_lock
+    full = queue.Full
+
+    while True:
+        try:
+            if conn is None:
+                conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+                try:
+                    # WAL lets this reader run without blocking the detector's writes
+                    conn.execute('PRAGMA journal_mode=WAL')
+                except sqlite3.OperationalError:
+                    pass
+                conn.execute('CREATE TABLE IF NOT EXISTS species_images (code TEXT PRIMARY KEY, url TEXT, ts TEXT)')
+            if last_id is None:
+                # Start from the latest ID currently in the DB
+                last_id = conn.execute('SELECT MAX(id) FROM detections').fetchone()[0] or 0
+
+            for det_id, timestamp, common_name, species_code, confidence, audio_file in conn.execute(query, (last_id,)).fetchall():
+                audio_url = f"/audio/{basename(audio_file)}" if audio_file else None
+                event = {
+                    'id': det_id,
+                    'timestamp': timestamp,
+                    'common_name': common_name,
+                    'species_code': species_code,
+                    'confidence': confidence,
+                    'audio_url': audio_url
+                }
+                # image_url is null when the species has no image; it is left out while the
+                # lookup is pending or failing, so clients only cache real answers
+                image_url = get_bird_image(conn, species_code, common_name)
+                if image_url is not IMAGE_UNKNOWN:
+                    event['image_url'] = image_url
+                # Serialized and framed once, however many clients are listening
+                message = b"data: " + dumps(event) + b"\n\n"
+                with subscribers_lock:
+                    subscribers = list(SUBSCRIBERS)
+                for q in subscribers:
+                    try:
+                        q.put_nowait(message)
+                    except full:
+                        pass  # slow client - drop rather than block everyone else
+                last_id = det_id
+
+        except Exception:
+            if conn is not None:
+                conn.close()
+                conn = None
+
+        sleep(poll_interval)
+
+def _ensure_detection_tailer():
+    global _detection_tailer
+    with _subscribers_lock:
+        if _detection_tailer is None:
+            _detection_tailer = threading.Thread(target=_tail_detections, name='detection-tailer', daemon=True)
+            _detection_tailer.start()
 
 @app.route('/api/events')
 def events():
     """SSE endpoint — streams new detections as they appear in the DB."""
     def generate():
-        # Start from the latest ID currently in the DB
-        conn = get_db()
-        cur = conn.cursor()
-        cur.execute('SELECT MAX(id) FROM detections')
-        row = cur.fetchone()
-        last_id = row[0] or 0
-        conn.close()
+        _ensure_detection_tailer()
+        q = queue.Queue(maxsize=256)
+        with _subscribers_lock:
+            SUBSCRIBERS.add(q)
 
         heartbeat_interval = 15
-        poll_interval = 2
-        last_heartbeat = time.time()
-
-        while True:
-            try:
-                conn = get_db()
-                cur = conn.cursor()
-                cur.execute('''
-                    SELECT id, timestamp, common_name, species_code, confidence, audio_file
-                    FROM detections
-                    WHERE id > ?
-                    ORDER BY id ASC
-                ''', (last_id,))
-                rows = cur.fetchall()
-                conn.close()
+        get, empty, heartbeat = q.get, queue.Empty, SSE_HEARTBEAT
 
-                for r in rows:
-                    audio_file = r['audio_file']
-                    audio_url = f"/audio/{os.path.basename(audio_file)}" if audio_file else None
-                    data = json.dumps({
-                        'id': r['id'],
-                        'timestamp': r['timestamp'],
-                        'common_name': r['common_name'],
-                        'species_code': r['species_code'],
-                        'confidence': r['confidence'],
-                        'audio_url': audio_url
-                    })
-                    yield f"data: {data}\n\n"
-                    last_id = r['id']
-
-                now = time.time()
-                if now - last_heartbeat >= heartbeat_interval:
-                    yield "event: heartbeat\ndata: ping\n\n"
-                    last_heartbeat = now
-
-            except Exception:
-                pass
-
-            time.sleep(poll_interval)
+        try:
+            while True:
+                try:
+                    yield get(timeout=heartbeat_interval)
+                except empty:
+                    yield heartbeat
+        finally:
+            with _subscribers_lock:
+                SUBSCRIBERS.discard(q)
 
     return Response(generate(), mimetype='text/event-stream',
                     headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
@@ -1329,6 +2019,7 @@ LIVE_HTML = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>BirdNET Live</title>
+    <link rel="preconnect" href="https://upload.wikimedia.org">
     <style>
         :root {
             --bg: #fafafa;
@@ -1430,12 +2121,23 @@ LIVE_HTML = '''
         .card {
             display: flex;
             gap: 14px;
+            height: 86px; /* fixed so the list can be windowed - keep CARD_STRIDE in sync */
             padding: 14px;
             background: var(--card-bg);
             border: 1px solid var(--card-border);
             border-radius: 10px;
             transition: opacity 0.8s, transform 0.4s;
             animation: fadeInDown 0.4s ease-out;
+            /* Own compositor layer, so age fades are GPU blends rather than repaints */
+            will-change: transform, opacity;
+            transform: translateZ(0);
+            contain: layout style;
+        }
+        /* Let the browser skip rendering overscan cards outside the viewport. Not on the newest
+           card: content-visibility implies paint containment, which would clip its shadow. */
+        .card:not(.newest) {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 86px;
         }
         .card.newest {
             border-color: rgba(45, 138, 104, 0.3);
@@ -1455,6 +2157,8 @@ LIVE_HTML = '''
             font-size: 1.05rem;
             font-style: italic;
             margin-bottom: 4px;
+            white-space: nowrap;
+            overflow: hidden;
             display: flex;
             justify-content: space-between;
             align-items: baseline;
@@ -1496,6 +2200,7 @@ LIVE_HTML = '''
             align-self: center;
         }
         .play-btn:hover { background: rgba(45, 138, 104, 0.3); }
+        .card [hidden] { display: none; }
         .footer {
             margin-top: 24px;
             padding-top: 16px;
@@ -1529,6 +2234,8 @@ LIVE_HTML = '''
         </div>
 
         <div class="cards" id="cards"></div>
+        <audio id="live-audio" preload="none" hidden></audio>
+        <template id="card-tpl"><div class="card"><img class="card-img" width="56" height="56" loading="lazy" decoding="async"><div class="card-body"><div class="card-name"><span class="name"></span> <span class="count"></span></div><div class="card-meta"><span class="confidence"></span><span class="time"></span></div></div><button class="play-btn">&#9654;</button></div></template>
 
         <div class="footer" id="footer">
             Today: 0 detections &middot; 0 species
@@ -1537,37 +2244,18 @@ LIVE_HTML = '''
 
 <script>
 (function() {
-    // State: species_code -> { common_name, species_code, count, bestConfidence, latestTimestamp, latestAudioUrl, latestId, imgUrl }
+    // State: species_code -> { common_name, species_code, count, bestConfidence, latestTs, latestAudioUrl, latestId, imgUrl }
+    // latestTs is epoch ms, parsed once per detection so renders never parse timestamp strings
+    // imgUrl is the remembered thumbnail (see imageFor), else the /api/bird-image proxy
     const speciesMap = {};
+    // speciesMap's entries ordered by latestTs, newest first - kept sorted as detections
+    // arrive (see placeSpecies) so renders never sort
+    let sortedSpecies = [];
     const EXPIRY_MS = 60 * 60 * 1000; // 1 hour
     const NOW_HEARING_FADE_MS = 2 * 60 * 1000; // fade "now hearing" after 2 min of silence
     let lastDetectionTime = 0;
     let totalToday = 0;
     let speciesSeenToday = new Set();
-    let evtSource = null;
-
-    // --- Image cache using localStorage ---
-    const IMG_CACHE_KEY = 'birdnet_img_cache';
-    const IMG_CACHE_TTL = 7 * 24 * 60 * 60 * 1000; // 7 days
-
-    function getImgCache() {
-        try {
-            return JSON.parse(localStorage.getItem(IMG_CACHE_KEY) || '{}');
-        } catch { return {}; }
-    }
-    function setImgCache(code, url) {
-        try {
-            const cache = getImgCache();
-            cache[code] = { url: url, ts: Date.now() };
-            localStorage.setItem(IMG_CACHE_KEY, JSON.stringify(cache));
-        } catch {}
-    }
-    function getCachedImg(code) {
-        const cache = getImgCache();
-        const entry = cache[code];
-        if (entry && (Date.now() - entry.ts) < IMG_CACHE_TTL) return entry.url;
-        return null;
-    }
 
     // Generic bird silhouette SVG as fallback
     const FALLBACK_IMG = 'data:image/svg+xml,' + encodeURIComponent(
@@ -1579,25 +2267,44 @@ LIVE_HTML = '''
         '</svg>'
     );
 
-    async function fetchBirdImage(commonName) {
-        const cached = getCachedImg(commonName);
-        if (cached) return cached;
+    // Thumbnails go through the app's /api/bird-image proxy, which redirects to the
+    // Wikipedia image (or serves a silhouette) and is cached by the browser for a week.
+    function birdImageUrl(commonName) {
+        return '/api/bird-image/' + encodeURIComponent(commonName);
+    }
+
+    // Thumbnails resolved by the server over SSE are remembered per species in memory and
+    // localStorage, including null for "no image", so later visits (and backfilled
+    // detections, which carry no image_url) skip the proxy round trip.
+    const IMG_CACHE_TTL_MS = 30 * 24 * 3600 * 1000;
+    const imgCache = new Map(); // species_code -> url, or null when the species has no image
+
+    function cachedImage(code) {
+        if (imgCache.has(code)) return imgCache.get(code);
         try {
-            // Use Wikipedia API to find the bird's image
-            const title = commonName.replace(/ /g, '_');
-            const url = 'https://en.wikipedia.org/api/rest_v1/page/summary/' + encodeURIComponent(title);
-            const resp = await fetch(url);
-            if (resp.ok) {
-                const data = await resp.json();
-                if (data.thumbnail && data.thumbnail.source) {
-                    const imgUrl = data.thumbnail.source;
-                    setImgCache(commonName, imgUrl);
-                    return imgUrl;
-                }
+            const entry = JSON.parse(localStorage.getItem('bird-img:' + code));
+            if (entry && Date.now() - entry.ts < IMG_CACHE_TTL_MS) {
+                imgCache.set(code, entry.url);
+                return entry.url;
             }
         } catch {}
-        setImgCache(commonName, FALLBACK_IMG);
-        return FALLBACK_IMG;
+        return undefined;
+    }
+
+    function rememberImage(code, url) {
+        imgCache.set(code, url);
+        try {
+            localStorage.setItem('bird-img:' + code, JSON.stringify({ url: url, ts: Date.now() }));
+        } catch {}
+    }
+
+    function imageFor(det) {
+        if (det.image_url !== undefined && det.image_url !== cachedImage(det.species_code)) {
+            rememberImage(det.species_code, det.image_url);
+        }
+        const url = cachedImage(det.species_code);
+        if (url === null) return FALLBACK_IMG;
+        return url || birdImageUrl(det.common_name);
     }
 
     // --- Clock ---
@@ -1610,12 +2317,22 @@ LIVE_HTML = '''
 
     // --- Formatting helpers ---
     function confClass(c) { return c >= 0.7 ? 'high' : c >= 0.4 ? 'med' : 'low'; }
+    // Both take epoch ms. fmtTime reuses one formatter (toLocaleTimeString builds a new one
+    // per call) and remembers each minute's string, since that is all the format shows.
+    const timeFormat = new Intl.DateTimeFormat([], { hour: 'numeric', minute: '2-digit' });
+    const timeCache = new Map();
     function fmtTime(ts) {
-        const d = new Date(ts);
-        return d.toLocaleTimeString([], { hour: 'numeric', minute: '2-digit' });
+        const minute = ts - (ts % 60000);
+        let text = timeCache.get(minute);
+        if (text === undefined) {
+            if (timeCache.size > 1024) timeCache.clear();
+            text = timeFormat.format(minute);
+            timeCache.set(minute, text);
+        }
+        return text;
     }
     function ageOpacity(ts) {
-        const age = Date.now() - new Date(ts).getTime();
+        const age = Date.now() - ts;
         const frac = age / EXPIRY_MS;
         if (frac < 0.25) return 1;
         if (frac < 0.5) return 0.85;
@@ -1623,137 +2340,309 @@ LIVE_HTML = '''
         return 0.45;
     }
 
+    // Move (or insert) a species to its place in sortedSpecies after its latestTs changed.
+    // Detections almost always arrive newest-last, so this is normally an unshift.
+    function placeSpecies(s) {
+        const i = sortedSpecies.indexOf(s);
+        if (i !== -1) sortedSpecies.splice(i, 1);
+        let lo = 0, hi = sortedSpecies.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (sortedSpecies[mid].latestTs > s.latestTs) lo = mid + 1; else hi = mid;
+        }
+        sortedSpecies.splice(lo, 0, s);
+    }
+
     // --- Process a detection (from backfill or SSE) ---
     function processDetection(det) {
         const code = det.species_code;
+        const ts = new Date(det.timestamp).getTime();
         speciesSeenToday.add(code);
 
         if (speciesMap[code]) {
             const s = speciesMap[code];
             s.count++;
-            if (new Date(det.timestamp) > new Date(s.latestTimestamp)) {
-                s.latestTimestamp = det.timestamp;
+            if (ts > s.latestTs) {
+                s.latestTs = ts;
                 s.latestAudioUrl = det.audio_url;
                 s.latestId = det.id;
+                placeSpecies(s);
             }
             if (det.confidence > s.bestConfidence) {
                 s.bestConfidence = det.confidence;
             }
+            if (det.image_url !== undefined) s.imgUrl = imageFor(det);
         } else {
             speciesMap[code] = {
                 common_name: det.common_name,
                 species_code: code,
                 count: 1,
                 bestConfidence: det.confidence,
-                latestTimestamp: det.timestamp,
+                latestTs: ts,
                 latestAudioUrl: det.audio_url,
                 latestId: det.id,
-                imgUrl: null
+                imgUrl: imageFor(det)
             };
-            // Fetch image async using common name (Wikipedia lookup)
-            fetchBirdImage(det.common_name).then(url => {
-                if (speciesMap[code]) {
-                    speciesMap[code].imgUrl = url;
-                    renderCards();
-                }
-            });
+            placeSpecies(speciesMap[code]);
         }
 
-        lastDetectionTime = Math.max(lastDetectionTime, new Date(det.timestamp).getTime());
+        lastDetectionTime = Math.max(lastDetectionTime, ts);
         totalToday++;
+        footerDirty = true;
     }
 
     // --- Render ---
-    function renderCards() {
-        // Remove expired species
-        const now = Date.now();
-        for (const code of Object.keys(speciesMap)) {
-            if (now - new Date(speciesMap[code].latestTimestamp).getTime() > EXPIRY_MS) {
-                delete speciesMap[code];
-            }
+    // Card elements are kept per species and updated in place, so a render only
+    // creates nodes for new species and removes nodes for expired ones.
+    const cardNodes = new Map(); // species_code -> { el, img, imgUrl, count, conf, time, btn }
+
+    // One delegated listener plays whichever card's button was clicked
+    document.getElementById('cards').addEventListener('click', e => {
+        const btn = e.target.closest('.play-btn');
+        if (btn && btn.dataset.audio) playAudio(btn.dataset.audio);
+    });
+    // Hovering a play button starts fetching its clip's metadata, unless something is playing
+    document.getElementById('cards').addEventListener('pointerover', e => {
+        const btn = e.target.closest('.play-btn');
+        if (btn && btn.dataset.audio && liveAudio.paused) {
+            liveAudio.preload = 'metadata';
+            loadAudio(btn.dataset.audio);
+        }
+    });
+
+    // Only cards near the viewport are attached; the rest of the list is padding.
+    // Detached nodes stay in cardNodes and are reattached when scrolled back into view.
+    const CARD_STRIDE = 98; // .card height (86px) + .cards gap (12px)
+    const OVERSCAN = 3;
+
+    // One <audio> element is reused for every clip instead of creating one per click
+    const liveAudio = document.getElementById('live-audio');
+
+    function loadAudio(url) {
+        if (liveAudio.getAttribute('src') !== url) liveAudio.src = url;
+    }
+
+    function playAudio(url) {
+        loadAudio(url);
+        liveAudio.currentTime = 0;
+        liveAudio.play();
+    }
+
+    // Card markup is parsed once from #card-tpl and cloned per species
+    const cardTpl = document.getElementById('card-tpl').content.firstElementChild;
+    const badImages = new Set(); // thumbnail URLs that failed to load this session
+
+    function cardImageSrc(url) {
+        return url && !badImages.has(url) ? url : FALLBACK_IMG;
+    }
+
+    function createCardNode(s) {
+        const card = cardTpl.cloneNode(true);
+        const img = card.querySelector('.card-img');
+        img.src = cardImageSrc(s.imgUrl);
+        img.alt = s.common_name;
+        card.querySelector('.name').textContent = s.common_name;
+        const node = {
+            el: card,
+            img: img,
+            imgUrl: s.imgUrl,
+            count: card.querySelector('.count'),
+            conf: card.querySelector('.confidence'),
+            time: card.querySelector('.time'),
+            btn: card.querySelector('.play-btn')
+        };
+        // Fall back to the silhouette once instead of retrying a broken thumbnail on every render
+        img.onerror = () => {
+            if (!node.imgUrl || badImages.has(node.imgUrl)) return;
+            badImages.add(node.imgUrl);
+            img.src = FALLBACK_IMG;
+        };
+        // Play the entry animation once, not every time the card scrolls back into the window
+        card.addEventListener('animationend', () => { card.style.animation = 'none'; });
+        return node;
+    }
+
+    // The parts of a card that change as its detection ages
+    function setCardAge(node, s, isNewest) {
+        node.el.classList.toggle('newest', isNewest);
+        const opacity = ageOpacity(s.latestTs);
+        if (node.opacity !== opacity) {
+            node.opacity = opacity;
+            node.el.style.opacity = opacity;
         }
+    }
 
-        // Sort by latest timestamp descending
-        const sorted = Object.values(speciesMap).sort(
-            (a, b) => new Date(b.latestTimestamp) - new Date(a.latestTimestamp)
-        );
+    function updateCardNode(node, s, isNewest) {
+        if (node.imgUrl !== s.imgUrl) {
+            node.imgUrl = s.imgUrl;
+            node.img.src = cardImageSrc(s.imgUrl);
+        }
+        setCardAge(node, s, isNewest);
+        // Strings are only rebuilt when the values behind them change
+        if (node.shownCount !== s.count) {
+            node.shownCount = s.count;
+            node.count.hidden = s.count < 2;
+            node.count.textContent = 'x' + s.count;
+        }
+        if (node.shownConfidence !== s.bestConfidence) {
+            node.shownConfidence = s.bestConfidence;
+            node.conf.className = 'confidence ' + confClass(s.bestConfidence);
+            node.conf.textContent = Math.round(s.bestConfidence * 100) + '%';
+        }
+        if (node.shownTs !== s.latestTs) {
+            node.shownTs = s.latestTs;
+            node.time.textContent = fmtTime(s.latestTs);
+            node.btn.hidden = !s.latestAudioUrl;
+            if (s.latestAudioUrl) node.btn.dataset.audio = s.latestAudioUrl;
+        }
+    }
 
-        const container = document.getElementById('cards');
-        container.innerHTML = '';
+    // Coalesce renders - a burst of SSE events or the backfill loop costs one render per frame
+    let renderScheduled = false;
+    function scheduleRender() {
+        if (renderScheduled) return;
+        renderScheduled = true;
+        requestAnimationFrame(() => {
+            renderScheduled = false;
+            renderCards();
+        });
+    }
 
-        sorted.forEach((s, i) => {
-            const opacity = ageOpacity(s.latestTimestamp);
-            const isNewest = i === 0 && (now - new Date(s.latestTimestamp).getTime() < 60000);
-            const card = document.createElement('div');
-            card.className = 'card' + (isNewest ? ' newest' : '');
-            card.style.opacity = opacity;
-
-            const imgSrc = s.imgUrl || FALLBACK_IMG;
-            const countBadge = s.count > 1 ? '<span class="count">x' + s.count + '</span>' : '';
-            const audioBtn = s.latestAudioUrl
-                ? '<button class="play-btn" data-audio="' + s.latestAudioUrl + '">&#9654;</button>'
-                : '';
-
-            card.innerHTML =
-                '<img class="card-img" src="' + imgSrc + '" alt="' + s.common_name + '" loading="lazy">' +
-                '<div class="card-body">' +
-                '  <div class="card-name">' + s.common_name + ' ' + countBadge + '</div>' +
-                '  <div class="card-meta">' +
-                '    <span class="confidence ' + confClass(s.bestConfidence) + '">' + Math.round(s.bestConfidence * 100) + '%</span>' +
-                '    <span>' + fmtTime(s.latestTimestamp) + '</span>' +
-                '  </div>' +
-                '</div>' +
-                audioBtn;
-
-            // Audio playback
-            const btn = card.querySelector('.play-btn');
-            if (btn) {
-                btn.addEventListener('click', function() {
-                    const url = this.getAttribute('data-audio');
-                    const existing = document.getElementById('live-audio');
-                    if (existing) { existing.pause(); existing.remove(); }
-                    const audio = document.createElement('audio');
-                    audio.id = 'live-audio';
-                    audio.src = url;
-                    audio.style.display = 'none';
-                    document.body.appendChild(audio);
-                    audio.play();
-                    audio.addEventListener('ended', function() { this.remove(); });
-                });
+    // Runs from the 30s refresh rather than every render - species only expire an hour
+    // after their last detection, so renders triggered by SSE never need to check.
+    // sortedSpecies is newest first, so expired species are always at its tail.
+    // Returns whether anything expired.
+    function expireSpecies() {
+        const cutoff = Date.now() - EXPIRY_MS;
+        const before = sortedSpecies.length;
+        while (sortedSpecies.length && sortedSpecies[sortedSpecies.length - 1].latestTs < cutoff) {
+            const code = sortedSpecies.pop().species_code;
+            delete speciesMap[code];
+            const node = cardNodes.get(code);
+            if (node) {
+                node.el.remove();
+                cardNodes.delete(code);
             }
+        }
+        return sortedSpecies.length !== before;
+    }
 
-            container.appendChild(card);
-        });
+    // "Now hearing" and the footer are only written when their text changes; the footer
+    // is marked dirty by the code that changes its counts.
+    const nowHearingEl = document.getElementById('now-hearing');
+    const nowSpeciesEl = document.getElementById('now-species');
+    const nowMetaEl = document.getElementById('now-meta');
+    const footerEl = document.getElementById('footer');
+    let nowHearingShown = null;
+    let footerDirty = true;
 
-        // Update "now hearing"
-        const nh = document.getElementById('now-hearing');
-        if (sorted.length > 0 && (now - lastDetectionTime < NOW_HEARING_FADE_MS)) {
-            nh.classList.remove('silent');
-            document.getElementById('now-species').textContent = sorted[0].common_name;
+    function renderCards() {
+        const now = Date.now();
+
+        renderWindow();
+        updateNowHearing(now);
+
+        if (footerDirty) {
+            footerDirty = false;
+            footerEl.textContent =
+                'Today: ' + totalToday + ' detections \\u00b7 ' + speciesSeenToday.size + ' species';
+        }
+    }
+
+    function updateNowHearing(now) {
+        const sorted = sortedSpecies;
+        let species = '\\u2014', meta = 'Waiting for birds\\u2026';
+        const hearing = sorted.length > 0 && (now - lastDetectionTime < NOW_HEARING_FADE_MS);
+        if (hearing) {
+            species = sorted[0].common_name;
             const ago = Math.round((now - lastDetectionTime) / 1000);
             const agoText = ago < 10 ? 'just now' : ago < 60 ? ago + 's ago' : Math.round(ago / 60) + 'm ago';
-            document.getElementById('now-meta').textContent =
-                Math.round(sorted[0].bestConfidence * 100) + '% confidence \\u00b7 ' + agoText;
-        } else {
-            nh.classList.add('silent');
-            document.getElementById('now-species').textContent = '\\u2014';
-            document.getElementById('now-meta').textContent = 'Waiting for birds\\u2026';
+            meta = Math.round(sorted[0].bestConfidence * 100) + '% confidence \\u00b7 ' + agoText;
+        }
+        const shown = species + '\\n' + meta;
+        if (shown !== nowHearingShown) {
+            nowHearingShown = shown;
+            nowHearingEl.classList.toggle('silent', !hearing);
+            nowSpeciesEl.textContent = species;
+            nowMetaEl.textContent = meta;
         }
+    }
 
-        // Footer
-        document.getElementById('footer').textContent =
-            'Today: ' + totalToday + ' detections \\u00b7 ' + speciesSeenToday.size + ' species';
+    // The 30s refresh only patches what depends on the clock - expiry, card opacity, the
+    // newest highlight and the "now hearing" age - instead of re-rendering.
+    function tickAges() {
+        const now = Date.now();
+        if (expireSpecies()) scheduleWindow(); // the list got shorter - re-pad the window
+        for (const [code, node] of cardNodes) {
+            const s = speciesMap[code];
+            setCardAge(node, s, s === sortedSpecies[0] && now - s.latestTs < 60000);
+        }
+        updateNowHearing(now);
     }
 
+    function renderWindow() {
+        const now = Date.now();
+        const sorted = sortedSpecies;
+        const container = document.getElementById('cards');
+        const top = container.getBoundingClientRect().top;
+        const start = Math.max(0, Math.floor(-top / CARD_STRIDE) - OVERSCAN);
+        const end = Math.min(sorted.length, Math.ceil((window.innerHeight - top) / CARD_STRIDE) + OVERSCAN);
+        const visible = sorted.slice(start, end);
+
+        const els = visible.map((s, j) => {
+            let node = cardNodes.get(s.species_code);
+            if (!node) {
+                node = createCardNode(s);
+                cardNodes.set(s.species_code, node);
+            }
+            const isNewest = start + j === 0 && (now - s.latestTs < 60000);
+            updateCardNode(node, s, isNewest);
+            return node.el;
+        });
+        // Swap the window in with a single mutation, and only when its cards or order changed
+        const current = container.children;
+        if (current.length !== els.length || els.some((el, j) => current[j] !== el)) {
+            container.replaceChildren(...els);
+        }
+        container.style.paddingTop = (start * CARD_STRIDE) + 'px';
+        container.style.paddingBottom = ((sorted.length - end) * CARD_STRIDE) + 'px';
+    }
+
+    let windowScheduled = false;
+    function scheduleWindow() {
+        if (windowScheduled) return;
+        windowScheduled = true;
+        requestAnimationFrame(() => {
+            windowScheduled = false;
+            renderWindow();
+        });
+    }
+    window.addEventListener('scroll', scheduleWindow, { passive: true });
+    window.addEventListener('resize', scheduleWindow);
+
     // --- Backfill last hour ---
     async function backfill() {
         const since = new Date(Date.now() - EXPIRY_MS).toISOString();
         try {
-            const resp = await fetch('/api/detections?limit=500&since=' + encodeURIComponent(since));
-            const data = await resp.json();
-            // Process oldest first
-            data.reverse().forEach(processDetection);
-            renderCards();
+            const resp = await fetch('/api/detections?format=ndjson&limit=500&since=' + encodeURIComponent(since));
+            // Rows arrive newest first, so the top cards can render before the rest has downloaded
+            const reader = resp.body.getReader();
+            const decoder = new TextDecoder();
+            let buf = '';
+            for (;;) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buf += decoder.decode(value, { stream: true });
+                const lines = buf.split('\\n');
+                buf = lines.pop();
+                for (const line of lines) {
+                    if (line) processDetection(JSON.parse(line));
+                }
+                scheduleRender();
+            }
+            if (buf) processDetection(JSON.parse(buf));
+            expireSpecies();
+            scheduleRender();
         } catch (e) {
             console.error('Backfill failed:', e);
         }
@@ -1765,35 +2654,94 @@ LIVE_HTML = '''
             const resp = await fetch('/api/stats');
             const stats = await resp.json();
             totalToday = stats.today || 0;
-            renderCards();
+            footerDirty = true;
+            scheduleRender();
         } catch {}
     }
 
     // --- SSE connection ---
-    function connectSSE() {
-        if (evtSource) evtSource.close();
-        evtSource = new EventSource('/api/events');
-
-        evtSource.onmessage = function(e) {
+    // Messages are buffered and processed in batches, so a burst of detections costs
+    // one pass and one render. Past SSE_BUF_MAX unprocessed messages new ones are dropped.
+    const SSE_BUF_MAX = 500;
+    const SSE_FLUSH_MS = 50;
+    const sseBuf = [];
+    let sseFlushScheduled = false;
+
+    function flushSse() {
+        sseFlushScheduled = false;
+        for (const data of sseBuf.splice(0)) {
             try {
-                const det = JSON.parse(e.data);
-                processDetection(det);
-                renderCards();
+                processDetection(JSON.parse(data));
             } catch {}
-        };
+        }
+        scheduleRender();
+    }
 
-        evtSource.onerror = function() {
-            document.getElementById('status-dot').classList.add('disconnected');
-            // EventSource auto-reconnects
-        };
+    function enqueueSse(data) {
+        if (sseBuf.length >= SSE_BUF_MAX) return;
+        sseBuf.push(data);
+        if (!sseFlushScheduled) {
+            sseFlushScheduled = true;
+            setTimeout(flushSse, SSE_FLUSH_MS);
+        }
+    }
 
-        evtSource.onopen = function() {
-            document.getElementById('status-dot').classList.remove('disconnected');
-        };
+    // The stream is read with fetch() and parsed here rather than through EventSource,
+    // so frames that arrive together are split in one pass without an event dispatch each.
+    // Reconnects back off exponentially with jitter; the server sends a heartbeat every
+    // 15s, so a stream that goes quiet for longer than SSE_STALL_MS is treated as dead.
+    const SSE_STALL_MS = 45000;
+    const SSE_RETRY_MIN_MS = 1000;
+    const SSE_RETRY_MAX_MS = 30000;
+    const statusDot = document.getElementById('status-dot');
+
+    async function readSSE() {
+        const ctrl = new AbortController();
+        let stall = setTimeout(() => ctrl.abort(), SSE_STALL_MS);
+        try {
+            const resp = await fetch('/api/events', { signal: ctrl.signal, cache: 'no-store' });
+            if (!resp.ok) throw new Error('HTTP ' + resp.status);
+            statusDot.classList.remove('disconnected');
+            sseRetries = 0;
+            const reader = resp.body.getReader();
+            const decoder = new TextDecoder();
+            let buf = '';
+            for (;;) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                clearTimeout(stall);
+                stall = setTimeout(() => ctrl.abort(), SSE_STALL_MS);
+                buf += decoder.decode(value, { stream: true });
+                const frames = buf.split('\\n\\n');
+                buf = frames.pop();
+                for (const frame of frames) {
+                    let event = 'message', data = [];
+                    for (const line of frame.split('\\n')) {
+                        if (line.startsWith('data:')) data.push(line.slice(line[5] === ' ' ? 6 : 5));
+                        else if (line.startsWith('event:')) event = line.slice(6).trim();
+                    }
+                    if (event === 'message' && data.length) enqueueSse(data.join('\\n'));
+                }
+            }
+        } finally {
+            clearTimeout(stall);
+        }
+    }
+
+    let sseRetries = 0;
+    async function connectSSE() {
+        for (;;) {
+            try {
+                await readSSE();
+            } catch {}
+            statusDot.classList.add('disconnected');
+            const backoff = Math.min(SSE_RETRY_MAX_MS, SSE_RETRY_MIN_MS * 2 ** sseRetries++);
+            await new Promise(resolve => setTimeout(resolve, backoff / 2 + Math.random() * backoff / 2));
+        }
     }
 
     // --- Periodic cleanup & refresh ---
-    setInterval(renderCards, 30000); // Re-render to update ages/opacity
+    setInterval(tickAges, 30000);
 
     // --- Init ---
     backfill().then(() => {
@@ -1806,9 +2754,11 @@ LIVE_HTML = '''
 </html>
 '''
 
+LIVE_PAGE, LIVE_ETAG = static_page(LIVE_HTML)
+
 @app.route('/live')
 def live():
-    return render_template_string(LIVE_HTML)
+    return page_response(LIVE_PAGE, LIVE_ETAG)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)